@@ -1,10 +1,14 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, time, timezone
 import yfinance as yf
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 import math
+import os
+import tempfile
+import threading
 
 # Configuración de la página
 st.set_page_config(
@@ -14,156 +18,16 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# CSS personalizado para ocultar la barra lateral
-hide_sidebar = """
-    <style>
-        [data-testid="collapsedControl"] {
-            display: none
-        }
-        [data-testid="stSidebarNav"] {
-            display: none
-        }
-    </style>
-"""
-st.markdown(hide_sidebar, unsafe_allow_html=True)
-
-# Estilos personalizados
-st.markdown("""
-    <style>
-        :root {
-            --color-trap: #E63946;
-            --color-illusion: #F77F00;
-            --color-break: #06A77D;
-            --color-unconfiscable: #2D6A4F;
-            --color-dark: #0B0E11;
-            --color-text: #FFFFFF;
-        }
-        
-        body {
-            background-color: var(--color-dark);
-            color: var(--color-text);
-        }
-        
-        .hero-section {
-            background: linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%);
-            padding: 60px 20px;
-            text-align: center;
-            border-bottom: 3px solid #E63946;
-        }
-        
-        .hero-title {
-            font-size: 3em;
-            font-weight: bold;
-            margin-bottom: 20px;
-            background: linear-gradient(90deg, #E63946, #F77F00, #06A77D, #2D6A4F);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-        
-        .pillar-section {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin: 40px 0;
-        }
-        
-        .pillar-card {
-            padding: 30px;
-            border-radius: 10px;
-            border-left: 5px solid;
-            color: white;
-        }
-        
-        .pillar-trap {
-            background-color: rgba(230, 57, 70, 0.1);
-            border-left-color: #E63946;
-        }
-        
-        .pillar-illusion {
-            background-color: rgba(247, 127, 0, 0.1);
-            border-left-color: #F77F00;
-        }
-        
-        .pillar-break {
-            background-color: rgba(6, 168, 125, 0.1);
-            border-left-color: #06A77D;
-        }
-        
-        .pillar-unconfiscable {
-            background-color: rgba(45, 106, 79, 0.1);
-            border-left-color: #2D6A4F;
-        }
-        
-        .calculator-section {
-            background-color: rgba(30, 30, 30, 0.8);
-            padding: 40px;
-            border-radius: 10px;
-            margin: 40px 0;
-            border: 2px solid #06A77D;
-        }
-        
-        .results-section {
-            margin: 40px 0;
-        }
-        
-        .scenario-card {
-            padding: 30px;
-            border-radius: 10px;
-            margin: 20px 0;
-        }
-        
-        .scenario-a {
-            background-color: rgba(230, 57, 70, 0.15);
-            border: 2px solid #E63946;
-        }
-        
-        .scenario-b {
-            background-color: rgba(45, 106, 79, 0.15);
-            border: 2px solid #2D6A4F;
-        }
-        
-        .metric {
-            display: flex;
-            justify-content: space-between;
-            padding: 10px 0;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        }
-        
-        .metric-label {
-            font-weight: bold;
-        }
-        
-        .metric-value {
-            color: #06A77D;
-            font-weight: bold;
-        }
-        
-        .cta-button {
-            background-color: #2D6A4F;
-            color: white;
-            padding: 15px 30px;
-            border: none;
-            border-radius: 5px;
-            font-size: 16px;
-            cursor: pointer;
-            margin: 20px 0;
-            width: 100%;
-        }
-        
-        .cta-button:hover {
-            background-color: #06A77D;
-        }
-        
-        .footer {
-            text-align: center;
-            padding: 40px 20px;
-            border-top: 1px solid rgba(255, 255, 255, 0.1);
-            margin-top: 60px;
-            color: rgba(255, 255, 255, 0.7);
-        }
-    </style>
-""", unsafe_allow_html=True)
+# Contenido estático (hoja de estilos, hero, pilares y textos) servido desde static/ como componente.
+# El navegador descarga y cachea esos ficheros una vez; en cada rerun solo viaja el nombre de la página.
+_static_page = components.declare_component(
+    "static_page",
+    path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+)
+
+def static_page(page: str) -> None:
+    """Renderiza una de las páginas de static/index.html (también inyecta styles.css en la app)"""
+    _static_page(page=page, key=f"static_{page}", default=None)
 
 # Funciones de utilidad
 @st.cache_data
@@ -247,6 +111,218 @@ def get_bitcoin_prices(start_date: datetime, end_date: datetime) -> dict:
         st.error(f"❌ Error al obtener precios de Bitcoin: {str(e)}")
         return {}
 
+# ============ HISTÓRICO HORARIO ============
+
+# Almacén en disco por bloques anuales: un fichero .npy por año con registros (timestamp UTC, cierre).
+# Se lee con memmap y por años, nunca se carga el histórico horario completo en memoria.
+HOURLY_STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "btc_hourly")
+HOURLY_CHUNK_PREFIX = "BTC-USD_1h_"
+HOURLY_DTYPE = np.dtype([('ts', '<i8'), ('close', '<f8')])
+HOURLY_BAR_SECONDS = 3600
+# Hueco tolerado entre velas guardadas: Yahoo omite alguna hora suelta; más que eso falta histórico
+HOURLY_MAX_GAP_SECONDS = HOURLY_BAR_SECONDS
+# Yahoo Finance solo sirve velas de 1 hora de los últimos 730 días
+HOURLY_MAX_DAYS = 729
+
+def _hourly_chunk_path(year: int) -> str:
+    """Ruta del fichero anual del histórico horario"""
+    return os.path.join(HOURLY_STORE_DIR, f"{HOURLY_CHUNK_PREFIX}{year}.npy")
+
+def _hourly_store_years() -> List[int]:
+    """Años disponibles en el almacén horario, en orden ascendente"""
+    if not os.path.isdir(HOURLY_STORE_DIR):
+        return []
+    
+    years = []
+    for name in os.listdir(HOURLY_STORE_DIR):
+        if name.startswith(HOURLY_CHUNK_PREFIX) and name.endswith(".npy"):
+            try:
+                years.append(int(name[len(HOURLY_CHUNK_PREFIX):-len(".npy")]))
+            except ValueError:
+                continue
+    return sorted(years)
+
+@st.cache_resource
+def _hourly_store_lock() -> threading.Lock:
+    """Cerrojo compartido por todas las sesiones para descargar y escribir en el almacén"""
+    return threading.Lock()
+
+def _load_hourly_chunk(year: int) -> np.ndarray:
+    """Abre el bloque de un año en modo memmap (solo se leen de disco las páginas que se usan)"""
+    path = _hourly_chunk_path(year)
+    if not os.path.exists(path):
+        return np.empty(0, dtype=HOURLY_DTYPE)
+    try:
+        return np.load(path, mmap_mode='r')
+    except Exception as e:
+        st.error(f"❌ No se pudo leer el histórico horario de {year}: {str(e)}")
+        return np.empty(0, dtype=HOURLY_DTYPE)
+
+def _to_ts(moment: datetime) -> int:
+    """Segundos desde epoch de un instante UTC sin zona horaria"""
+    return int(np.datetime64(moment, 's').astype(np.int64))
+
+def _from_ts(ts: int) -> datetime:
+    """Instante UTC sin zona horaria a partir de segundos desde epoch"""
+    return datetime.fromtimestamp(int(ts), timezone.utc).replace(tzinfo=None)
+
+def _years_of(timestamps: np.ndarray) -> np.ndarray:
+    """Año UTC de cada timestamp (segundos desde epoch)"""
+    return timestamps.astype('datetime64[s]').astype('datetime64[Y]').astype(np.int64) + 1970
+
+def _write_hourly_records(records: np.ndarray) -> None:
+    """Fusiona los registros descargados con los bloques anuales existentes"""
+    os.makedirs(HOURLY_STORE_DIR, exist_ok=True)
+    record_years = _years_of(records['ts'])
+    
+    for year in np.unique(record_years):
+        existing = np.array(_load_hourly_chunk(int(year)))
+        # Los datos nuevos van primero para que prevalezcan sobre los guardados
+        merged = np.concatenate([records[record_years == year], existing])
+        _, first_idx = np.unique(merged['ts'], return_index=True)
+        merged = merged[first_idx]
+        
+        # Fichero temporal único para que una escritura a medias nunca sustituya al bloque
+        tmp_file = tempfile.NamedTemporaryFile(dir=HOURLY_STORE_DIR, suffix=".tmp", delete=False)
+        try:
+            with tmp_file:
+                np.save(tmp_file, merged)
+            os.replace(tmp_file.name, _hourly_chunk_path(int(year)))
+        except Exception:
+            # Sin dejar temporales huérfanos en el almacén
+            os.unlink(tmp_file.name)
+            raise
+
+def _download_hourly(start: datetime, end: datetime) -> np.ndarray:
+    """
+    Descarga velas de 1 hora de yfinance y las devuelve como registros (ts, cierre).
+    Solo se guardan velas terminadas: el cierre de la vela en curso es el precio del momento.
+    """
+    btc_data = yf.download('BTC-USD', start=start, end=end, interval='1h', progress=False)
+    if btc_data.empty:
+        return np.empty(0, dtype=HOURLY_DTYPE)
+    
+    # Vale tanto para columnas simples como para MultiIndex (formato reciente de yfinance)
+    close = btc_data['Close']
+    if isinstance(close, pd.DataFrame):
+        close = close.iloc[:, 0]
+    close = close.dropna()
+    close = close[close > 0]
+    
+    index = close.index
+    index = index.tz_localize('UTC') if index.tz is None else index.tz_convert('UTC')
+    records = np.empty(len(close), dtype=HOURLY_DTYPE)
+    records['ts'] = index.tz_localize(None).values.astype('datetime64[s]').astype(np.int64)
+    records['close'] = close.to_numpy(dtype=float)
+    
+    now_ts = _to_ts(datetime.now(timezone.utc).replace(tzinfo=None))
+    return records[records['ts'] + HOURLY_BAR_SECONDS <= now_ts]
+
+def hourly_store_range() -> Optional[Tuple[datetime, datetime]]:
+    """Primer y último instante (UTC) guardados en el almacén horario"""
+    years = [year for year in _hourly_store_years() if len(_load_hourly_chunk(year))]
+    if not years:
+        return None
+    return _from_ts(_load_hourly_chunk(years[0])['ts'][0]), _from_ts(_load_hourly_chunk(years[-1])['ts'][-1])
+
+def _hourly_missing_ranges(start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+    """
+    Tramos de [start, end) sin velas guardadas, calculados con los timestamps reales del almacén
+    (el almacén puede tener huecos entre consultas que no se solapan).
+    """
+    start_ts, end_ts = _to_ts(start), _to_ts(end)
+    if start_ts >= end_ts:
+        return []
+    
+    stored = []
+    for year in range(start.year, end.year + 1):
+        chunk_ts = _load_hourly_chunk(year)['ts']
+        lo, hi = np.searchsorted(chunk_ts, [start_ts, end_ts], side='left')
+        stored.append(np.asarray(chunk_ts[lo:hi]))
+    stored = np.concatenate(stored)
+    
+    # Cada hueco va del cierre de una vela a la apertura de la siguiente; start y end hacen de extremos
+    closes = np.concatenate([[start_ts], stored + HOURLY_BAR_SECONDS])
+    opens = np.concatenate([stored, [end_ts]])
+    gaps = np.flatnonzero(opens - closes > HOURLY_MAX_GAP_SECONDS)
+    return [(_from_ts(closes[i]), _from_ts(opens[i])) for i in gaps]
+
+def update_hourly_store(start_date: datetime, end_date: datetime) -> bool:
+    """
+    Completa el almacén horario descargando solo los tramos que faltan.
+    Devuelve True si la descarga fue bien y hay precios horarios guardados
+    (la cobertura de cada compra se comprueba en calculate_dca_hourly).
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    fetch_start = max(datetime.combine(start_date, time.min), now - timedelta(days=HOURLY_MAX_DAYS))
+    fetch_end = min(datetime.combine(end_date, time.min) + timedelta(days=1), now)
+    
+    # Las sesiones de Streamlit son hilos del mismo proceso: una sola descarga y escritura a la vez
+    with _hourly_store_lock():
+        try:
+            for start, end in _hourly_missing_ranges(fetch_start, fetch_end):
+                records = _download_hourly(start, end)
+                if len(records):
+                    _write_hourly_records(records)
+        except Exception as e:
+            st.error(f"❌ Error al obtener precios horarios de Bitcoin: {str(e)}")
+            return False
+    
+    stored = hourly_store_range()
+    if stored is None:
+        st.error("❌ No hay precios horarios de Bitcoin disponibles. Desactiva los precios horarios e inténtalo de nuevo.")
+        return False
+    return True
+
+def lookup_hourly_prices(purchase_times: List[datetime]) -> np.ndarray:
+    """
+    Precio de cada instante de compra: cierre de la última vela horaria ya terminada
+    (yfinance fecha las velas por su apertura, así que una vela cierra en ts + 1 h).
+    Recorre el almacén bloque a bloque; los instantes deben venir ordenados.
+    Devuelve NaN en compras anteriores al cierre de la primera vela guardada y en compras
+    pasadas cuya última vela terminada es demasiado antigua (hueco).
+    """
+    targets = np.array(purchase_times, dtype='datetime64[s]').astype(np.int64)
+    target_years = _years_of(targets)
+    prices = np.full(len(targets), np.nan)
+    # Apertura de la vela usada para cada compra (-1: ninguna)
+    bar_ts = np.full(len(targets), -1, dtype=np.int64)
+    last_price = np.nan
+    last_ts = -1
+    cursor = 0
+    
+    for year in _hourly_store_years():
+        chunk = _load_hourly_chunk(year)
+        if not len(chunk):
+            continue
+        
+        # Compras en años sin bloque propio: último precio conocido
+        lo = int(np.searchsorted(target_years, year, side='left'))
+        prices[cursor:lo] = last_price
+        bar_ts[cursor:lo] = last_ts
+        hi = int(np.searchsorted(target_years, year, side='right'))
+        
+        if hi > lo:
+            # Última vela con ts + 1 h <= instante de compra (sin mirar al futuro)
+            idx = np.searchsorted(chunk['ts'], targets[lo:hi] - HOURLY_BAR_SECONDS, side='right') - 1
+            found = idx >= 0
+            safe_idx = np.clip(idx, 0, None)
+            prices[lo:hi] = np.where(found, np.asarray(chunk['close'])[safe_idx], last_price)
+            bar_ts[lo:hi] = np.where(found, np.asarray(chunk['ts'])[safe_idx], last_ts)
+        cursor = hi
+        
+        last_price = float(chunk['close'][-1])
+        last_ts = int(chunk['ts'][-1])
+    
+    prices[cursor:] = last_price
+    bar_ts[cursor:] = last_ts
+    
+    # Compras pasadas sin vela reciente: no se reutiliza un precio antiguo
+    now_ts = _to_ts(datetime.now(timezone.utc).replace(tzinfo=None))
+    stale = (bar_ts >= 0) & (targets <= now_ts) & (targets - (bar_ts + HOURLY_BAR_SECONDS) > HOURLY_MAX_GAP_SECONDS)
+    prices[stale] = np.nan
+    return prices
+
 def get_purchase_dates(start_date: datetime, end_date: datetime, frequency: str, 
                        day_of_week: int = None, day_of_month: int = None) -> List[datetime]:
     """Genera lista de fechas de compra según la frecuencia especificada"""
@@ -294,6 +370,21 @@ def get_purchase_dates(start_date: datetime, end_date: datetime, frequency: str,
     
     return sorted(list(set(dates)))
 
+def get_purchase_times(start_date: datetime, end_date: datetime, frequency: str,
+                       day_of_week: int = None, day_of_month: int = None, hour: int = 0) -> List[datetime]:
+    """Genera lista de instantes de compra (UTC) para simulaciones con precios horarios"""
+    if frequency == "Cada 4 horas":
+        times = []
+        current_time = datetime.combine(start_date, time(hour))
+        end_time = datetime.combine(end_date, time.max)
+        while current_time <= end_time:
+            times.append(current_time)
+            current_time += timedelta(hours=4)
+        return times
+    
+    return [datetime.combine(date, time(hour))
+            for date in get_purchase_dates(start_date, end_date, frequency, day_of_week, day_of_month)]
+
 def calculate_dca(start_date: datetime, end_date: datetime, amount_usd: float, 
                   frequency: str, day_of_week: int = None, day_of_month: int = None,
                   bitcoin_prices: dict = None) -> Tuple[float, float, list]:
@@ -345,6 +436,51 @@ def calculate_dca(start_date: datetime, end_date: datetime, amount_usd: float,
     
     return total_btc, total_invested, purchases
 
+def calculate_dca_hourly(start_date: datetime, end_date: datetime, amount_usd: float,
+                         frequency: str, day_of_week: int = None, day_of_month: int = None,
+                         hour: int = 0) -> Tuple[float, float, list]:
+    """Calcula DCA con precios horarios leídos del almacén en disco (mismo retorno que calculate_dca)"""
+    
+    purchase_times = get_purchase_times(start_date, end_date, frequency, day_of_week, day_of_month, hour)
+    
+    if not purchase_times:
+        return 0, 0, []
+    
+    prices = lookup_hourly_prices(purchase_times)
+    missing = np.flatnonzero(np.isnan(prices))
+    if len(missing):
+        first_missing = purchase_times[missing[0]]
+        stored = hourly_store_range()
+        if stored is None:
+            st.error("❌ No hay precios horarios de Bitcoin disponibles. Desactiva los precios horarios e inténtalo de nuevo.")
+        elif first_missing < stored[0] + timedelta(seconds=HOURLY_BAR_SECONDS):
+            # La primera vela guardada aún no había cerrado: no se usa un precio posterior a la compra
+            st.error(f"❌ El histórico horario solo está disponible desde el "
+                     f"{stored[0] + timedelta(seconds=HOURLY_BAR_SECONDS):%Y-%m-%d %H:%M} UTC. "
+                     "Elige una fecha de inicio u hora de compra posterior o desactiva los precios horarios.")
+        else:
+            st.error(f"❌ Faltan precios horarios de Bitcoin cerca del {first_missing:%Y-%m-%d %H:%M} UTC. "
+                     "Inténtalo de nuevo más tarde o desactiva los precios horarios.")
+        return 0, 0, []
+    
+    total_btc = 0
+    total_invested = 0
+    purchases = []
+    
+    for target_time, price in zip(purchase_times, prices):
+        if not np.isnan(price) and price > 0:
+            btc_bought = amount_usd / price
+            total_btc += btc_bought
+            total_invested += amount_usd
+            purchases.append({
+                'date': target_time,
+                'price': float(price),
+                'amount_usd': amount_usd,
+                'btc_bought': btc_bought
+            })
+    
+    return total_btc, total_invested, purchases
+
 def calculate_cagr(initial_value: float, final_value: float, years: float) -> float:
     """Calcula CAGR (Compound Annual Growth Rate)"""
     if initial_value <= 0 or years <= 0:
@@ -353,66 +489,8 @@ def calculate_cagr(initial_value: float, final_value: float, years: float) -> fl
 
 # ============ INTERFAZ PRINCIPAL ============
 
-# Hero Section
-st.markdown("""
-    <div class="hero-section">
-        <h1 class="hero-title">El Camino Hacia Lo Inconfiscable</h1>
-        <p style="font-size: 1.2em; color: rgba(255, 255, 255, 0.8);">
-            Descubre cómo escapar del control del sistema financiero tradicional
-        </p>
-    </div>
-""", unsafe_allow_html=True)
-
-# Los 4 Pilares
-st.markdown("## Los Cuatro Pilares del Viaje")
-
-col1, col2 = st.columns(2)
-
-with col1:
-    st.markdown("""
-        <div class="pillar-card pillar-trap">
-            <h3>🔴 La Trampa</h3>
-            <p>Fondos en exchanges centralizados son confiscables. 
-            Trazabilidad 100%. El Estado sabe cuándo, cómo y cuánto compraste.</p>
-        </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("""
-        <div class="pillar-card pillar-break">
-            <h3>🔵 La Ruptura</h3>
-            <p>Compra Token DM2. Intercambia USDC por DM2. 
-            Rompe la trazabilidad onchain anonimizando tus fondos.</p>
-        </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("""
-        <div class="pillar-card pillar-illusion">
-            <h3>🟠 La Ilusión</h3>
-            <p>Autocustodia previene confiscación inmediata, PERO 
-            la trazabilidad permanece. Las autoridades saben que lo tienes.</p>
-        </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("""
-        <div class="pillar-card pillar-unconfiscable">
-            <h3>🟢 Lo Inconfiscable</h3>
-            <p>Rompe la trazabilidad. Obtén verdadera privacidad y control total. 
-            Tus activos descentralizados. Solo tú los controlas.</p>
-        </div>
-    """, unsafe_allow_html=True)
-
-# Sección de Calculadora
-st.markdown("## Simula Tu Futuro Inconfiscable")
-
-st.markdown("""
-    <div class="calculator-section">
-        <p style="font-size: 1.1em; color: rgba(255, 255, 255, 0.9);">
-            Descubre la diferencia entre comprar Bitcoin de forma tradicional (atrapado en el sistema) 
-            versus de forma anónima y descentralizada (verdaderamente inconfiscable).
-        </p>
-    </div>
-""", unsafe_allow_html=True)
+# Hero, los 4 pilares e introducción a la calculadora
+static_page("intro")
 
 # Inputs de la calculadora
 col1, col2 = st.columns(2)
@@ -431,11 +509,17 @@ with col1:
         value=500.0,
         step=10.0
     )
+    
+    use_hourly = st.checkbox(
+        "⏱️ Usar precios horarios (solo últimos 2 años)",
+        value=False,
+        help="Compra al precio de la hora elegida (cierre de la vela horaria que termina a esa hora) en lugar del cierre diario y permite recompras cada 4 horas."
+    )
 
 with col2:
     frequency = st.selectbox(
         "📊 Frecuencia de recompras",
-        ["Diaria", "Semanal", "Mensual"]
+        ["Diaria", "Semanal", "Mensual"] + (["Cada 4 horas"] if use_hourly else [])
     )
     
     if frequency == "Semanal":
@@ -456,6 +540,12 @@ with col2:
     else:
         day_of_week_num = None
         day_of_month = None
+    
+    purchase_hour = st.selectbox(
+        "🕐 Hora de compra (UTC)",
+        list(range(24)),
+        index=0
+    ) if use_hourly else 0
 
 col1, col2 = st.columns(2)
 
@@ -485,19 +575,35 @@ if calculate_button:
     else:
         with st.spinner("⏳ Obteniendo datos históricos de Bitcoin desde Yahoo Finance..."):
             # Obtener precios históricos usando yfinance
-            bitcoin_prices = get_bitcoin_prices(start_date, future_date)
+            if use_hourly:
+                # El histórico horario se guarda por años en disco y se lee por bloques
+                prices_available = update_hourly_store(start_date, future_date)
+            else:
+                bitcoin_prices = get_bitcoin_prices(start_date, future_date)
+                prices_available = bool(bitcoin_prices)
             
-            if bitcoin_prices:
+            if prices_available:
                 # Calcular DCA para ambos escenarios
-                btc_accumulated, total_invested, purchases = calculate_dca(
-                    start_date,
-                    future_date,
-                    amount_usd,
-                    frequency,
-                    day_of_week_num if frequency == "Semanal" else None,
-                    day_of_month if frequency == "Mensual" else None,
-                    bitcoin_prices
-                )
+                if use_hourly:
+                    btc_accumulated, total_invested, purchases = calculate_dca_hourly(
+                        start_date,
+                        future_date,
+                        amount_usd,
+                        frequency,
+                        day_of_week_num if frequency == "Semanal" else None,
+                        day_of_month if frequency == "Mensual" else None,
+                        purchase_hour
+                    )
+                else:
+                    btc_accumulated, total_invested, purchases = calculate_dca(
+                        start_date,
+                        future_date,
+                        amount_usd,
+                        frequency,
+                        day_of_week_num if frequency == "Semanal" else None,
+                        day_of_month if frequency == "Mensual" else None,
+                        bitcoin_prices
+                    )
                 
                 if btc_accumulated > 0.0001 and total_invested > 0 and len(purchases) > 0:
                     # Cálculos para Escenario A (La Trampa)
@@ -582,40 +688,7 @@ if calculate_button:
                     # Informe comparativo
                     st.markdown("## 🎯 Opciones Como Ser Inconfiscable")
                     
-                    st.markdown("""
-                        ### Vivir de tus Bitcoin sin venderlos
-                        
-                        Una vez que eres inconfiscable, tienes opciones que los atrapados en el sistema no tienen:
-                        
-                        **Préstamo Pignorado**: Puedes usar tus Bitcoin como colateral para obtener un préstamo en USD o stablecoins, 
-                        sin necesidad de venderlos. Esto significa:
-                        
-                        - **Mantener tu exposición a Bitcoin**: Tus BTC siguen creciendo mientras usas el dinero del préstamo
-                        - **Vivir del préstamo**: Usa los fondos para tus gastos diarios
-                        - **Pagar intereses bajos**: Plataformas DeFi ofrecen tasas mucho menores que bancos tradicionales
-                        - **Sin confiscación**: Nadie puede quitarte tus Bitcoin porque están en tu autocustodia
-                        - **Privacidad total**: Tus transacciones no están vinculadas a tu identidad
-                        
-                        ### Comparación con el Escenario A (La Trampa)
-                        
-                        Si estuvieras atrapado en el sistema tradicional:
-                        
-                        - **Tendrías que vender** para acceder a tu dinero (pagando impuestos sobre ganancias)
-                        - **El Estado sabría** exactamente cuándo y cuánto vendiste
-                        - **Estarías vigilado** en cada transacción
-                        - **No tendrías privacidad** financiera real
-                        - **Tus fondos estarían en riesgo** de confiscación
-                        
-                        ### La Libertad Financiera Real
-                        
-                        Ser inconfiscable significa:
-                        
-                        - **Control total** sobre tus activos
-                        - **Privacidad financiera** completa
-                        - **Libertad** para hacer lo que quieras con tu dinero
-                        - **Protección** contra la confiscación y el control estatal
-                        - **Oportunidades** que el sistema tradicional nunca te dará
-                    """)
+                    static_page("options")
                     
                     # Formulario de registro
                     st.markdown("---")